@@ -1,8 +1,16 @@
 import streamlit as st
 import asyncio
 import tempfile
+import threading
 import os
-from main import extract_fields, validate_extracted_data
+from main import (
+    FieldEvaluation,
+    get_embeddings,
+    get_model,
+    get_openai_client,
+    stream_extract_and_validate,
+    use_direct_openai,
+)
 
 # Page configuration
 st.set_page_config(
@@ -11,6 +19,51 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_resource
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Start a long-lived event loop so HTTP connections stay warm across reruns."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+@st.cache_resource
+def warm_models():
+    """
+    Initialize the LLM clients on the shared loop once per process, outside the request path.
+    
+    Warming is only an optimization: on failure (e.g. a missing API key) a
+    warning is shown and the clients are initialized on the first request.
+    """
+    async def warm():
+        # The semantic cache always uses LangChain embeddings
+        get_embeddings()
+        # Extraction and validation use whichever call path is active
+        if use_direct_openai():
+            get_openai_client()
+        else:
+            get_model(json_mode=True)
+            get_model(schema=FieldEvaluation)
+    
+    try:
+        asyncio.run_coroutine_threadsafe(warm(), get_loop()).result()
+    except Exception as e:
+        st.warning(f"⚠️ Could not initialize the LLM clients: {str(e)}")
+
+warm_models()
+
+
+def iterate_on_loop(async_gen, loop: asyncio.AbstractEventLoop):
+    """Consume an async generator running on the shared loop from the script thread."""
+    async def next_item():
+        return await async_gen.__anext__()
+    
+    while True:
+        try:
+            yield asyncio.run_coroutine_threadsafe(next_item(), loop).result()
+        except StopAsyncIteration:
+            return
+
 # Title and description
 st.title("📄 LLM-Powered Resume Information Extraction")
 st.markdown("Upload a PDF resume and extract structured information using advanced LLM technology.")
@@ -79,21 +132,14 @@ if extract_button and uploaded_file:
     try:
         # Show progress
         with st.spinner("🔄 Processing PDF and extracting information..."):
-            # Run async extraction
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            # Extract fields
-            extracted_data = loop.run_until_complete(
-                extract_fields(tmp_file_path, fields_description)
-            )
-            
-            # Validate results
-            validation_result = loop.run_until_complete(
-                validate_extracted_data(fields_description, extracted_data)
-            )
-            
-            loop.close()
+            # Stream extracted fields, rendering partial results until validation arrives
+            preview = st.empty()
+            for extracted_data, validation_result in iterate_on_loop(
+                stream_extract_and_validate(tmp_file_path, fields_description), get_loop()
+            ):
+                if validation_result is None:
+                    preview.json(extracted_data)
+            preview.empty()
         
         # Display results
         st.success("✅ Extraction completed successfully!")
@@ -0,0 +1,253 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+import faiss
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(os.getenv("RESUME_EXTRACTOR_CACHE_DIR", Path.home() / ".resume_extractor" / "cache"))
+CACHE_TTL = timedelta(days=7)
+SEMANTIC_CACHE_DIR = CACHE_DIR / "semantic"
+SEMANTIC_SEARCH_K = 4
+
+# In-memory semantic indexes per namespace: (FAISS index, entries aligned with its rows)
+_semantic_indexes: dict[str, tuple[faiss.Index, list[dict]]] = {}
+_semantic_lock = threading.Lock()
+
+
+def _cache_path(input_hash: str) -> Path:
+    """Return the cache file path for an input hash."""
+    return CACHE_DIR / f"{input_hash}.json"
+
+
+def _new_entry(model_id: str, response: Any) -> dict:
+    """Build the metadata common to all cache entries."""
+    created_at = datetime.now(timezone.utc)
+    return {
+        "modelId": model_id,
+        "response": response,
+        "createdAt": created_at.isoformat(),
+        "expiresAt": (created_at + CACHE_TTL).isoformat(),
+    }
+
+
+def _is_expired(entry: dict) -> bool:
+    """Check whether a cache entry has passed its expiry time."""
+    return datetime.fromisoformat(entry["expiresAt"]) <= datetime.now(timezone.utc)
+
+
+def check_cache(input_hash: str, prompt_version: str) -> Any | None:
+    """
+    Look up a cached LLM response.
+
+    Args:
+        input_hash: SHA-256 hash of the LLM input
+        prompt_version: Prompt version the response must have been produced with
+
+    Returns:
+        The cached response, or None on miss, expiry, version mismatch or
+        an unreadable or malformed entry
+    """
+    path = _cache_path(input_hash)
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            entry = json.load(file)
+        if entry.get("promptVersion") != prompt_version:
+            return None
+        expired = _is_expired(entry)
+        response = entry["response"]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+    if expired:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return None
+
+    return response
+
+
+def save_to_cache(input_hash: str, prompt_version: str, model_id: str, response: Any) -> None:
+    """
+    Persist an LLM response to the on-disk cache.
+
+    Best-effort: write errors (e.g. an unwritable cache directory or a full
+    disk) are logged and ignored so they never fail the request.
+
+    Args:
+        input_hash: SHA-256 hash of the LLM input
+        prompt_version: Prompt version used to produce the response
+        model_id: Identifier of the model that produced the response
+        response: JSON-serializable response (str or dict)
+    """
+    entry = {
+        "inputHash": input_hash,
+        "promptVersion": prompt_version,
+        **_new_entry(model_id, response),
+    }
+
+    tmp_path = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with open(fd, 'w', encoding='utf-8') as file:
+            json.dump(entry, file, ensure_ascii=False)
+        os.replace(tmp_path, _cache_path(input_hash))
+    except OSError:
+        logger.warning("Saving to the response cache failed", exc_info=True)
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def _normalize(embedding: list[float]) -> np.ndarray:
+    """Return the embedding as a unit-length float32 row vector."""
+    vector = np.asarray([embedding], dtype=np.float32)
+    faiss.normalize_L2(vector)
+    return vector
+
+
+def _semantic_path(namespace: str) -> Path:
+    """Return the JSON Lines file backing a semantic index namespace."""
+    return SEMANTIC_CACHE_DIR / f"{namespace}.jsonl"
+
+
+def _write_semantic_file(namespace: str, index: faiss.Index, entries: list[dict]) -> None:
+    """Rewrite a namespace's file from its index vectors and entries."""
+    vectors = index.reconstruct_n(0, index.ntotal) if index.ntotal else []
+    SEMANTIC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=SEMANTIC_CACHE_DIR, suffix=".tmp")
+    try:
+        with open(fd, 'w', encoding='utf-8') as file:
+            for vector, entry in zip(vectors, entries):
+                file.write(json.dumps({"embedding": vector.tolist(), **entry}, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, _semantic_path(namespace))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _get_semantic_index(namespace: str, dimension: int) -> tuple[faiss.Index, list[dict]]:
+    """
+    Return the semantic index for a namespace, loading it from disk if needed.
+
+    Expired, unreadable or malformed rows (including a missing embedding or
+    one of another dimension) are dropped on load, and the file is
+    rewritten without them.
+    """
+    if namespace not in _semantic_indexes:
+        rows, vectors, pruned = [], [], False
+        try:
+            with open(_semantic_path(namespace), 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        row = json.loads(line)
+                        vector = _normalize(row.pop("embedding"))
+                        if vector.shape != (1, dimension) or "response" not in row or _is_expired(row):
+                            raise ValueError("stale semantic cache row")
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        pruned = True
+                        continue
+                    rows.append(row)
+                    vectors.append(vector)
+        except OSError:
+            pass
+
+        index = faiss.IndexFlatIP(dimension)
+        if vectors:
+            index.add(np.vstack(vectors))
+        if pruned:
+            _write_semantic_file(namespace, index, rows)
+        _semantic_indexes[namespace] = (index, rows)
+    return _semantic_indexes[namespace]
+
+
+def _prune_semantic_index(namespace: str) -> tuple[faiss.Index, list[dict]]:
+    """Drop expired rows from a loaded namespace, rewriting its file if any were removed."""
+    index, entries = _semantic_indexes[namespace]
+    keep = [row for row, entry in enumerate(entries) if not _is_expired(entry)]
+    if len(keep) == len(entries):
+        return index, entries
+
+    pruned_index = faiss.IndexFlatIP(index.d)
+    if keep:
+        pruned_index.add(index.reconstruct_n(0, index.ntotal)[keep])
+    pruned_entries = [entries[row] for row in keep]
+    _write_semantic_file(namespace, pruned_index, pruned_entries)
+    _semantic_indexes[namespace] = (pruned_index, pruned_entries)
+    return pruned_index, pruned_entries
+
+
+def check_semantic_cache(
+    embedding: list[float], fields_hash: str, prompt_version: str, threshold: float
+) -> Any | None:
+    """
+    Look up a cached response for semantically similar content.
+
+    The nearest non-expired neighbours are searched, so an expired top hit
+    does not hide a valid one.
+
+    Args:
+        embedding: Embedding of the content
+        fields_hash: Hash of the field descriptions the response was produced for
+        prompt_version: Prompt version the response must have been produced with
+        threshold: Minimum cosine similarity for a hit
+
+    Returns:
+        The cached response of the most similar content, or None on miss
+    """
+    namespace = f"{prompt_version}-{fields_hash}"
+    with _semantic_lock:
+        index, entries = _get_semantic_index(namespace, len(embedding))
+        if index.ntotal == 0:
+            return None
+        similarities, ids = index.search(_normalize(embedding), min(SEMANTIC_SEARCH_K, index.ntotal))
+
+    for similarity, row in zip(similarities[0], ids[0]):
+        if row < 0 or similarity < threshold:
+            break
+        if not _is_expired(entries[row]):
+            return entries[row]["response"]
+    return None
+
+
+def save_to_semantic_cache(
+    embedding: list[float], fields_hash: str, prompt_version: str, model_id: str, response: Any
+) -> None:
+    """
+    Add a response to the semantic cache and persist it.
+
+    The entry is appended to the namespace file; expired rows are pruned
+    first, which is the only time the file is rewritten.
+
+    Args:
+        embedding: Embedding of the content
+        fields_hash: Hash of the field descriptions used to produce the response
+        prompt_version: Prompt version used to produce the response
+        model_id: Identifier of the model that produced the response
+        response: JSON-serializable response
+    """
+    namespace = f"{prompt_version}-{fields_hash}"
+    with _semantic_lock:
+        _get_semantic_index(namespace, len(embedding))
+        index, entries = _prune_semantic_index(namespace)
+
+        vector = _normalize(embedding)
+        entry = _new_entry(model_id, response)
+        index.add(vector)
+        entries.append(entry)
+
+        SEMANTIC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_semantic_path(namespace), 'a', encoding='utf-8') as file:
+            file.write(json.dumps({"embedding": vector[0].tolist(), **entry}, ensure_ascii=False) + "\n")
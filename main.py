@@ -1,124 +1,731 @@
 import asyncio
-import json
+import functools
+import hashlib
+import itertools
+import logging
+import multiprocessing
 import os
 import re
-from typing import List, Dict, Any
+import string
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, Callable, Iterable, List, Dict, Any
+import httpx
+import orjson
+import pymupdf
+import pymupdf4llm
+from openai import NOT_GIVEN, AsyncOpenAI
+from pydantic import BaseModel, Field
 from langchain_core.language_models import BaseChatModel
+from langchain_core.utils.json import parse_partial_json
 from langchain.chat_models import init_chat_model
+from langchain_openai import OpenAIEmbeddings
 from langchain_unstructured import UnstructuredLoader
-from langchain_core.documents import Document
+from cache import check_cache, save_to_cache, check_semantic_cache, save_to_semantic_cache
 
 
-# Global model instances
-_model = None
-_json_model = None
+logger = logging.getLogger(__name__)
 
-if os.getenv("ENVIRONMENT") == "development":
+# Model and prompt versioning (bump PROMPT_VERSION when prompt.md changes)
+MODEL_ID = "gpt-4o-mini"
+PROMPT_VERSION = "v4"
+
+# Semantic cache for near-duplicate resumes
+EMBEDDING_MODEL_ID = "text-embedding-3-small"
+SEMANTIC_CACHE_THRESHOLD = 0.97
+
+# Minimum characters of embedded text for an image-bearing page to skip OCR
+MIN_TEXT_LAYER_CHARS = 50
+
+# Bounds concurrent PDF parsing across worker threads
+_parse_semaphore = threading.BoundedSemaphore(os.cpu_count() or 1)
+
+# Maximum number of concurrent per-field validation calls
+VALIDATION_CONCURRENCY = 8
+
+# Separates the static instructions from the dynamic part of a prompt template
+PROMPT_SECTION_SEPARATOR = "\n---\n"
+
+# Per-event-loop clients (pooled HTTP/2 client and the models holding it)
+_loop_clients: Dict[asyncio.AbstractEventLoop, Dict[str, Any]] = {}
+
+# Whether nest_asyncio has been applied (development only)
+_nest_applied = False
+
+
+class FieldEvaluation(BaseModel):
+    """Validation result for a single extracted field."""
+    score: int = Field(ge=0, le=10, description="Quality score from 0 to 10")
+    coverage: str = Field(description="What was found or missing")
+    correctness: str = Field(description="Assessment of accuracy and appropriateness")
+    issues: str = Field(description="Specific problems or suggestions")
+
+
+def _ensure_nest() -> None:
+    """
+    Apply nest_asyncio to the running loop once, in development only.
+    
+    Called from inside the LLM call paths, so it only helps nested loop use
+    that happens after the first call (e.g. later notebook cells).
+    """
+    global _nest_applied
+    
+    if _nest_applied or os.getenv("ENVIRONMENT") != "development":
+        return
+    
     import nest_asyncio
-    try:
-        loop = asyncio.get_running_loop()
-        if type(loop).__name__ != "Loop":
-            nest_asyncio.apply()
-    except RuntimeError:
+    if type(asyncio.get_running_loop()).__name__ != "Loop":
         nest_asyncio.apply()
+    _nest_applied = True
+
+
+def has_text_layer(file_path: str) -> bool:
+    """
+    Check whether every page of a PDF has an embedded text layer.
+    
+    A page with images but little embedded text is treated as scanned, so
+    mixed documents (e.g. a typed cover page followed by scans) go to OCR.
+    Blank pages do not count as scanned.
+    """
+    with pymupdf.open(file_path) as pdf:
+        for page in pdf:
+            if len(page.get_text().strip()) < MIN_TEXT_LAYER_CHARS and page.get_images():
+                return False
+    return True
+
+
+def _join_pages(pages: Iterable[tuple[int, str]]) -> str:
+    """Join (page number, text) pairs into newline-delimited "## Page N" sections."""
+    return "\n\n".join(f"## Page {number}\n{text.strip()}" for number, text in pages)
+
+
+def _load_text_pdf(file_path: str) -> str:
+    """Convert a text-based PDF with PyMuPDF4LLM (blocking), one section per page."""
+    with _parse_semaphore:
+        chunks = pymupdf4llm.to_markdown(file_path, page_chunks=True)
+        return _join_pages(enumerate((chunk["text"] for chunk in chunks), start=1))
+
+
+def _load_scanned_pdf(file_path: str) -> str:
+    """Parse a scanned PDF with UnstructuredLoader's hi_res (layout + OCR) strategy (blocking)."""
+    loader = UnstructuredLoader(
+        file_path=file_path,
+        strategy="hi_res",
+    )
+    
+    # Unstructured yields layout elements in reading order; group them by their
+    # page_number so pages without elements do not shift later page labels
+    pages = itertools.groupby(loader.lazy_load(), key=lambda doc: doc.metadata.get("page_number"))
+    page_texts = (
+        (page_number or position, "\n".join(doc.page_content for doc in elements))
+        for position, (page_number, elements) in enumerate(pages, start=1)
+    )
+    return _join_pages(page_texts) or "PDF content unavailable"
+
+
+def _load_pdf_sync(file_path: str) -> str:
+    """
+    Load and return PDF content (blocking), one section per page.
+    
+    Text-based PDFs are converted directly with PyMuPDF4LLM; scanned or
+    mixed PDFs fall back to UnstructuredLoader's hi_res (layout + OCR) strategy.
+    """
+    if has_text_layer(file_path):
+        return _load_text_pdf(file_path)
+    with _parse_semaphore:
+        return _load_scanned_pdf(file_path)
+
+
+def _init_parse_worker() -> None:
+    """
+    Load the Unstructured layout model once per parsing worker process.
+    
+    Failures are logged rather than raised: an initializer error would
+    break the whole pool, while the loader can still load the model lazily.
+    """
+    try:
+        from unstructured_inference.models.base import get_model as get_layout_model
+        get_layout_model()
+    except Exception:
+        logger.warning("Preloading the layout model failed; it will load on first use", exc_info=True)
 
 
-async def load_pdf_content(file_path: str) -> str:
+def _new_parse_pool() -> ProcessPoolExecutor:
+    """Create the process pool for OCR parsing; workers are spawned lazily on first use."""
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_parse_worker,
+    )
+
+
+_parse_pool = _new_parse_pool()
+_parse_pool_lock = threading.Lock()
+
+
+def _replace_broken_parse_pool(broken_pool: ProcessPoolExecutor) -> ProcessPoolExecutor:
+    """Replace the OCR process pool after it broke, unless another caller already did."""
+    global _parse_pool
+    
+    with _parse_pool_lock:
+        if _parse_pool is broken_pool:
+            broken_pool.shutdown(wait=False, cancel_futures=True)
+            _parse_pool = _new_parse_pool()
+        return _parse_pool
+
+
+async def load_pdf_content(file_path: str, executor: Executor | None = None) -> str:
     """
     Load and return PDF content.
     
+    Parsing never blocks the event loop: text-based PDFs are converted in
+    a worker thread, while scanned or mixed PDFs are OCR'd in a process
+    pool so batches use multiple cores. An explicit executor overrides both.
+    
     Args:
         file_path: Path to the PDF file
+        executor: Optional executor to run the parser in
         
     Returns:
         str: The content from the PDF
     """
-    loader = UnstructuredLoader(
-        file_path=file_path,
-        strategy="hi_res",
-    )
-    
-    docs: list[Document] = []
-    for doc in loader.lazy_load():
-        docs.append(doc)
+    loop = asyncio.get_running_loop()
+    if executor is not None:
+        return await loop.run_in_executor(executor, _load_pdf_sync, file_path)
     
-    if docs:
-        docs_content: list[str] = [doc.page_content for doc in docs]
-        return ' '.join(docs_content)
+    if await asyncio.to_thread(has_text_layer, file_path):
+        return await asyncio.to_thread(_load_text_pdf, file_path)
     
-    return "PDF content unavailable"
+    # A worker crash breaks the whole pool; rebuild it and retry once
+    pool = _parse_pool
+    try:
+        return await loop.run_in_executor(pool, _load_scanned_pdf, file_path)
+    except BrokenProcessPool:
+        logger.warning("OCR process pool broke; recreating it", exc_info=True)
+        pool = _replace_broken_parse_pool(pool)
+        return await loop.run_in_executor(pool, _load_scanned_pdf, file_path)
 
 
+@functools.lru_cache(maxsize=16)
 def read_markdown_file(file_path: str) -> str:
-    """Read and return markdown file content."""
+    """Read and return markdown file content (cached for the process lifetime)."""
     with open(file_path, 'r', encoding='utf-8') as file:
         return file.read()
 
 
-def get_model(json_mode: bool = False) -> BaseChatModel:
-    """Get the global model instance, initializing if needed."""
-    global _model, _json_model
+@functools.lru_cache(maxsize=16)
+def read_prompt_template(file_path: str) -> tuple[str, str]:
+    """
+    Split a prompt template into its static instructions and dynamic part.
+    
+    The static part is sent as the system message so it forms a stable
+    prefix for provider-side prompt caching.
+    
+    Args:
+        file_path: Path to the markdown prompt template
+        
+    Returns:
+        tuple[str, str]: The static instructions and the dynamic template
+    """
+    template = read_markdown_file(file_path)
+    static_part, _, dynamic_part = template.partition(PROMPT_SECTION_SEPARATOR)
+    return static_part.strip(), dynamic_part.strip()
+
+
+@functools.lru_cache(maxsize=16)
+def compile_prompt_template(file_path: str) -> tuple[str, Callable[..., str]]:
+    """
+    Precompile a prompt template's dynamic part into a render function.
+    
+    The template is parsed once; rendering only concatenates the literal
+    text with the given values. Placeholders must be plain `{name}` fields.
+    
+    Args:
+        file_path: Path to the markdown prompt template
+        
+    Returns:
+        tuple: The static instructions and a function rendering the dynamic
+            part from keyword arguments
+    """
+    instructions, template = read_prompt_template(file_path)
+    parts = [(literal, name) for literal, name, _, _ in string.Formatter().parse(template)]
+    
+    def render(**values: Any) -> str:
+        return "".join(
+            literal if name is None else f"{literal}{values[name]}" for literal, name in parts
+        )
+    
+    return instructions, render
+
+
+def _get_loop_clients() -> Dict[str, Any]:
+    """
+    Get the client instances for the running event loop, initializing if needed.
+    
+    Pooled httpx connections belong to the loop that opened them, so the
+    shared HTTP client and every model holding it are kept per loop; clients
+    of closed loops are dropped. Must be called from a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    for other in list(_loop_clients):
+        if other.is_closed():
+            _loop_clients.pop(other, None)
+    
+    if loop not in _loop_clients:
+        _loop_clients[loop] = {
+            "http_client": httpx.AsyncClient(
+                http2=True,
+                timeout=60,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+            ),
+            "schema_models": {},
+        }
+    return _loop_clients[loop]
+
+
+def get_model(json_mode: bool = False, schema: type[BaseModel] | None = None) -> BaseChatModel:
+    """
+    Get the model instance for the running event loop, initializing if needed.
+    
+    With a schema, the model uses native structured output (strict JSON
+    schema) so decoding is constrained to that shape.
+    """
+    clients = _get_loop_clients()
+    
+    if schema is not None:
+        schema_models = clients["schema_models"]
+        if schema not in schema_models:
+            schema_models[schema] = get_model().with_structured_output(
+                schema, method="json_schema", strict=True
+            )
+        return schema_models[schema]
+    elif json_mode:
+        if "json_model" not in clients:
+            base_model = init_chat_model(MODEL_ID, model_provider="openai", http_async_client=clients["http_client"])
+            clients["json_model"] = base_model.with_structured_output(method="json_mode")
+        return clients["json_model"]
+    else:
+        if "model" not in clients:
+            clients["model"] = init_chat_model(MODEL_ID, model_provider="openai", http_async_client=clients["http_client"])
+        return clients["model"]
+
+
+def get_embeddings() -> OpenAIEmbeddings:
+    """Get the embeddings instance for the running event loop, initializing if needed."""
+    clients = _get_loop_clients()
+    
+    if "embeddings" not in clients:
+        clients["embeddings"] = OpenAIEmbeddings(model=EMBEDDING_MODEL_ID, http_async_client=clients["http_client"])
+    return clients["embeddings"]
+
+
+async def _semantic_cache_lookup(fields_description: str, content: str) -> tuple[list[float] | None, str, dict | None]:
+    """
+    Look up an extraction for near-duplicate content in the semantic cache.
+    
+    Embedding or index errors are treated as a cache miss.
     
-    if json_mode:
-        if _json_model is None:
-            base_model = init_chat_model("gpt-4o-mini", model_provider="openai")
-            _json_model = base_model.with_structured_output(method="json_mode")
-        return _json_model
+    Returns:
+        tuple: The content embedding (None if embedding failed), the field
+            descriptions hash, and the cached extraction (None on miss)
+    """
+    fields_hash = hashlib.sha256(fields_description.encode()).hexdigest()
+    try:
+        embedding = await get_embeddings().aembed_query(content)
+    except Exception:
+        logger.warning("Semantic cache lookup skipped: embedding failed", exc_info=True)
+        return None, fields_hash, None
+    
+    try:
+        cached = check_semantic_cache(embedding, fields_hash, PROMPT_VERSION, SEMANTIC_CACHE_THRESHOLD)
+    except Exception:
+        logger.warning("Semantic cache lookup failed", exc_info=True)
+        cached = None
+    return embedding, fields_hash, cached
+
+
+def _semantic_cache_save(embedding: list[float] | None, fields_hash: str, result: dict) -> None:
+    """Store an extraction in the semantic cache, ignoring cache errors."""
+    if embedding is None:
+        return
+    try:
+        save_to_semantic_cache(embedding, fields_hash, PROMPT_VERSION, MODEL_ID, result)
+    except Exception:
+        logger.warning("Semantic cache save failed", exc_info=True)
+
+
+def _llm_cache_key(
+    input_data: str, json_mode: bool, system_prompt: str | None, schema: type[BaseModel] | None = None
+) -> str:
+    """Compute the response cache key for an LLM input."""
+    if schema is not None:
+        mode = f"schema:{schema.__name__}"
     else:
-        if _model is None:
-            _model = init_chat_model("gpt-4o-mini", model_provider="openai")
-        return _model
+        mode = "json" if json_mode else "text"
+    return hashlib.sha256(
+        f"{PROMPT_VERSION}:{mode}:{system_prompt or ''}:{input_data}".encode()
+    ).hexdigest()
+
+
+def _build_messages(input_data: str, system_prompt: str | None) -> str | list[dict]:
+    """Build the LLM input, sending static instructions as the system message."""
+    if system_prompt:
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": input_data},
+        ]
+    return input_data
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """Get the OpenAI client for the direct call path on the running event loop, initializing if needed."""
+    clients = _get_loop_clients()
+    
+    if "openai_client" not in clients:
+        clients["openai_client"] = AsyncOpenAI(http_client=clients["http_client"])
+    return clients["openai_client"]
 
-async def call_llm(input_data: str, json_mode: bool = False) -> str | dict:
+
+def use_direct_openai() -> bool:
     """
-    Call LLM async with invoke mode or JSON mode.
+    Whether call_llm and stream_llm_json should bypass LangChain and call the OpenAI Responses API.
+    
+    Controlled by USE_DIRECT_OPENAI ("1"/"0"); defaults to on in production.
+    """
+    flag = os.getenv("USE_DIRECT_OPENAI")
+    if flag is not None:
+        return flag == "1"
+    return os.getenv("ENVIRONMENT") == "production"
+
+
+def _raise_for_openai_response(response: Any) -> None:
+    """Raise a clear error for incomplete, failed or refused Responses API results."""
+    if response.status != "completed":
+        if response.incomplete_details is not None:
+            detail = response.incomplete_details.reason
+        elif response.error is not None:
+            detail = response.error.message
+        else:
+            detail = "no details"
+        raise RuntimeError(f"OpenAI response {response.status}: {detail}")
+    
+    for item in response.output:
+        for part in getattr(item, "content", None) or []:
+            if part.type == "refusal":
+                raise RuntimeError(f"OpenAI refused the request: {part.refusal}")
+
+
+async def _call_openai_direct(
+    input_data: str,
+    json_mode: bool,
+    system_prompt: str | None,
+    schema: type[BaseModel] | None,
+) -> str | dict:
+    """
+    Call the OpenAI Responses API directly, returning the same shapes as call_llm.
+    
+    Responses are not stored server-side (store=False), matching the
+    chat-completions path, since inputs contain resume PII.
+    """
+    if schema is not None:
+        response = await get_openai_client().responses.parse(
+            model=MODEL_ID,
+            instructions=system_prompt or NOT_GIVEN,
+            input=input_data,
+            text_format=schema,
+            store=False,
+        )
+        _raise_for_openai_response(response)
+        if response.output_parsed is None:
+            raise RuntimeError(f"OpenAI response did not match the {schema.__name__} schema")
+        return response.output_parsed.model_dump()
+    
+    response = await get_openai_client().responses.create(
+        model=MODEL_ID,
+        instructions=system_prompt or NOT_GIVEN,
+        input=input_data,
+        text={"format": {"type": "json_object"}} if json_mode else NOT_GIVEN,
+        store=False,
+    )
+    _raise_for_openai_response(response)
+    if not json_mode:
+        return response.output_text
+    try:
+        return orjson.loads(response.output_text)
+    except orjson.JSONDecodeError as e:
+        raise RuntimeError(f"OpenAI response is not valid JSON: {e}") from e
+
+
+async def _stream_openai_direct(input_data: str, system_prompt: str | None) -> AsyncIterator[dict]:
+    """Stream a JSON-mode Responses API call directly, yielding progressively more complete dicts."""
+    stream = await get_openai_client().responses.create(
+        model=MODEL_ID,
+        instructions=system_prompt or NOT_GIVEN,
+        input=input_data,
+        text={"format": {"type": "json_object"}},
+        store=False,
+        stream=True,
+    )
+    
+    buffer, last = "", None
+    async for event in stream:
+        if event.type == "response.output_text.delta":
+            buffer += event.delta
+            try:
+                partial = parse_partial_json(buffer)
+            except ValueError:
+                continue
+            if isinstance(partial, dict) and partial != last:
+                last = partial
+                yield partial
+        elif event.type in ("response.completed", "response.incomplete", "response.failed"):
+            _raise_for_openai_response(event.response)
+        elif event.type == "error":
+            raise RuntimeError(f"OpenAI stream error: {event.message}")
+    
+    try:
+        result = orjson.loads(buffer)
+    except orjson.JSONDecodeError as e:
+        raise RuntimeError(f"OpenAI response is not valid JSON: {e}") from e
+    if result != last:
+        yield result
+
+
+async def call_llm(
+    input_data: str,
+    json_mode: bool = False,
+    system_prompt: str | None = None,
+    schema: type[BaseModel] | None = None,
+) -> str | dict:
+    """
+    Call LLM async with invoke mode, JSON mode or a structured output schema.
+    
+    Responses are cached on disk, keyed on the prompt version and input.
+    Uses LangChain unless use_direct_openai() selects the direct OpenAI path.
     
     Args:
         input_data: Input message to send to the LLM
         json_mode: Whether to use JSON mode for structured output
+        system_prompt: Optional static instructions sent as the system message
+        schema: Optional Pydantic model the response must conform to
         
     Returns:
         str | dict: The response content (str) or parsed JSON (dict) from the LLM
     """
-    model = get_model(json_mode=json_mode)
-    result = await model.ainvoke(input_data)
+    _ensure_nest()
+    
+    input_hash = _llm_cache_key(input_data, json_mode, system_prompt, schema)
+    cached = check_cache(input_hash, PROMPT_VERSION)
+    if cached is not None:
+        return cached
+    
+    if use_direct_openai():
+        response = await _call_openai_direct(input_data, json_mode, system_prompt, schema)
+    else:
+        model = get_model(json_mode=json_mode, schema=schema)
+        result = await model.ainvoke(_build_messages(input_data, system_prompt))
+        if schema is not None:
+            response = result.model_dump()
+        else:
+            response = result if json_mode else result.content
+    
+    save_to_cache(input_hash, PROMPT_VERSION, MODEL_ID, response)
+    return response
+
+
+async def stream_llm_json(input_data: str, system_prompt: str | None = None) -> AsyncIterator[dict]:
+    """
+    Stream an LLM JSON-mode response as progressively more complete dicts.
+    
+    Uses LangChain unless use_direct_openai() selects the direct OpenAI path.
+    A cache hit yields the cached response once; otherwise the final
+    complete response is cached when the stream ends.
+    
+    Args:
+        input_data: Input message to send to the LLM
+        system_prompt: Optional static instructions sent as the system message
+        
+    Yields:
+        dict: The partial JSON parsed so far
+    """
+    _ensure_nest()
     
-    if json_mode:
-        return result
+    input_hash = _llm_cache_key(input_data, True, system_prompt)
+    cached = check_cache(input_hash, PROMPT_VERSION)
+    if cached is not None:
+        yield cached
+        return
+    
+    if use_direct_openai():
+        stream = _stream_openai_direct(input_data, system_prompt)
     else:
-        return result.content
+        stream = get_model(json_mode=True).astream(_build_messages(input_data, system_prompt))
+    
+    response = None
+    async for partial in stream:
+        response = partial
+        yield partial
+    
+    if response is not None:
+        save_to_cache(input_hash, PROMPT_VERSION, MODEL_ID, response)
+
+
+def _format_extraction_prompt(fields_description: str, content: str) -> tuple[str, str]:
+    """Return the static extraction instructions and the formatted dynamic prompt."""
+    instructions, render_prompt = compile_prompt_template("prompt.md")
+    formatted_prompt = render_prompt(
+        fields_description=fields_description,
+        content=content
+    )
+    return instructions, formatted_prompt
+
+
+async def _extract_from_content(content: str, fields_description: str) -> dict:
+    """Extract structured fields from already-parsed PDF content."""
+    instructions, formatted_prompt = _format_extraction_prompt(fields_description, content)
+    
+    # Exact repeats are served from the response cache without embedding
+    cached = check_cache(_llm_cache_key(formatted_prompt, True, instructions), PROMPT_VERSION)
+    if cached is not None:
+        return cached
+    
+    # Reuse the extraction of a near-duplicate resume if available
+    embedding, fields_hash, cached = await _semantic_cache_lookup(fields_description, content)
+    if cached is not None:
+        return cached
+    
+    # Extract structured data using JSON mode
+    result = await call_llm(formatted_prompt, json_mode=True, system_prompt=instructions)
+    _semantic_cache_save(embedding, fields_hash, result)
+    return result
 
 
-async def extract_fields(pdf_path: str, fields_description: str) -> dict:
+async def _stream_from_content(content: str, fields_description: str) -> AsyncIterator[dict]:
+    """Extract structured fields from already-parsed PDF content, streaming partial results."""
+    instructions, formatted_prompt = _format_extraction_prompt(fields_description, content)
+    
+    # Exact repeats are served from the response cache without embedding
+    cached = check_cache(_llm_cache_key(formatted_prompt, True, instructions), PROMPT_VERSION)
+    if cached is not None:
+        yield cached
+        return
+    
+    # Reuse the extraction of a near-duplicate resume if available
+    embedding, fields_hash, cached = await _semantic_cache_lookup(fields_description, content)
+    if cached is not None:
+        yield cached
+        return
+    
+    partial = None
+    async for partial in stream_llm_json(formatted_prompt, system_prompt=instructions):
+        yield partial
+    
+    if partial is not None:
+        _semantic_cache_save(embedding, fields_hash, partial)
+
+
+async def extract_fields(pdf_path: str, fields_description: str, executor: Executor | None = None) -> dict:
     """
     Extract structured fields from a PDF file.
     
     Args:
         pdf_path: Path to the PDF file
         fields_description: Description of fields to extract
+        executor: Optional executor for the PDF parsing stage
         
     Returns:
         dict: Extracted fields in JSON format
     """
     # Load PDF content
+    content = await load_pdf_content(pdf_path, executor=executor)
+    return await _extract_from_content(content, fields_description)
+
+
+async def stream_fields(pdf_path: str, fields_description: str) -> AsyncIterator[dict]:
+    """
+    Extract structured fields from a PDF file, streaming partial results.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        fields_description: Description of fields to extract
+        
+    Yields:
+        dict: Extracted fields parsed so far; the last item is complete
+    """
     content = await load_pdf_content(pdf_path)
+    async for partial in _stream_from_content(content, fields_description):
+        yield partial
+
+
+async def extract_fields_batch(
+    paths: List[str],
+    fields_description: str,
+    concurrency: int = 8,
+    executor: Executor | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    Extract structured fields from multiple PDF files concurrently.
     
-    # Load and format prompt template
-    prompt_template = read_markdown_file("prompt.md")
-    formatted_prompt = prompt_template.format(
+    Args:
+        paths: Paths to the PDF files
+        fields_description: Description of fields to extract
+        concurrency: Maximum number of files processed at once
+        executor: Optional executor for the PDF parsing stage
+            (e.g. a ProcessPoolExecutor to use multiple cores)
+        
+    Returns:
+        list[dict]: Per-file results in input order, each with path,
+            status ("ok" or "error"), data or error, and elapsed_ms
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _extract_one(path: str) -> Dict[str, Any]:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                data = await extract_fields(path, fields_description, executor=executor)
+                result = {"path": path, "status": "ok", "data": data}
+            except Exception as e:
+                result = {"path": path, "status": "error", "error": str(e)}
+            result["elapsed_ms"] = round((time.perf_counter() - start) * 1000)
+            return result
+    
+    return await asyncio.gather(*[_extract_one(path) for path in paths])
+
+
+async def validate_one_field(field: str, value: Any, fields_description: str) -> Dict[str, Any]:
+    """
+    Validate a single extracted field using LLM evaluation.
+    
+    Args:
+        field: Name of the extracted field
+        value: Extracted value of the field
+        fields_description: Description of expected fields
+        
+    Returns:
+        dict: Field evaluation with score, coverage, correctness and issues
+    """
+    # Load validation prompt template; only the dynamic part is formatted
+    instructions, render_prompt = compile_prompt_template("validation_prompt.md")
+    formatted_prompt = render_prompt(
         fields_description=fields_description,
-        content=content
+        field_name=field,
+        field_value=orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
     )
     
-    # Extract structured data using JSON mode
-    result = await call_llm(formatted_prompt, json_mode=True)
-    return result
+    # Get field evaluation constrained to the FieldEvaluation schema
+    return await call_llm(formatted_prompt, system_prompt=instructions, schema=FieldEvaluation)
 
 
 async def validate_extracted_data(fields_description: str, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate extracted data using LLM evaluation.
     
+    Each field is evaluated by a separate LLM call; calls run concurrently
+    (bounded by VALIDATION_CONCURRENCY) and are aggregated locally.
+    
     Args:
         fields_description: Description of expected fields
         extracted_data: Extracted data dictionary
@@ -126,16 +733,114 @@ async def validate_extracted_data(fields_description: str, extracted_data: Dict[
     Returns:
         dict: LLM validation results with scores and feedback
     """
-    # Load and format validation prompt template
-    validation_template = read_markdown_file("validation_prompt.md")
-    formatted_prompt = validation_template.format(
-        fields_description=fields_description,
-        extracted_data=json.dumps(extracted_data, indent=2)
+    semaphore = asyncio.Semaphore(VALIDATION_CONCURRENCY)
+    
+    async def _guarded(field: str, value: Any) -> Dict[str, Any]:
+        async with semaphore:
+            return await validate_one_field(field, value, fields_description)
+    
+    evaluations = await asyncio.gather(
+        *[_guarded(field, value) for field, value in extracted_data.items()]
     )
+    field_evaluations = dict(zip(extracted_data.keys(), evaluations))
     
-    # Get validation results using JSON mode
-    validation_result = await call_llm(formatted_prompt, json_mode=True)
-    return validation_result
+    # Aggregate overall score and summary locally
+    scores = {field: _to_score(evaluation.get('score')) for field, evaluation in field_evaluations.items()}
+    overall_score = round(sum(scores.values()) / len(scores), 1) if scores else 0
+    weak_fields = [field for field, score in scores.items() if score < 6]
+    if weak_fields:
+        summary = f"{len(scores)} fields evaluated; needs attention: {', '.join(weak_fields)}."
+    else:
+        summary = f"{len(scores)} fields evaluated; all fields scored 6 or higher."
+    
+    return {
+        "overall_score": overall_score,
+        "field_evaluations": field_evaluations,
+        "summary": summary,
+    }
+
+
+def _to_score(value: Any) -> float:
+    """Coerce an LLM-provided score to a float, defaulting to 0."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _result_cache_key(fields_description: str, content: str) -> str:
+    """Compute the cache key for a combined extraction and validation result."""
+    return hashlib.sha256(
+        f"{PROMPT_VERSION}:result:{fields_description}:{content}".encode()
+    ).hexdigest()
+
+
+async def extract_and_validate(
+    pdf_path: str, fields_description: str, executor: Executor | None = None
+) -> tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Extract structured fields from a PDF file and validate them.
+    
+    The pair is cached as a single entry, so a repeated run on the same
+    content and field descriptions skips both extraction and validation.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        fields_description: Description of fields to extract
+        executor: Optional executor for the PDF parsing stage
+        
+    Returns:
+        tuple[dict, dict]: Extracted fields and validation results
+    """
+    content = await load_pdf_content(pdf_path, executor=executor)
+    result_hash = _result_cache_key(fields_description, content)
+    cached = check_cache(result_hash, PROMPT_VERSION)
+    if cached is not None:
+        return cached["extracted_data"], cached["validation_result"]
+    
+    extracted_data = await _extract_from_content(content, fields_description)
+    validation_result = await validate_extracted_data(fields_description, extracted_data)
+    save_to_cache(result_hash, PROMPT_VERSION, MODEL_ID, {
+        "extracted_data": extracted_data,
+        "validation_result": validation_result,
+    })
+    return extracted_data, validation_result
+
+
+async def stream_extract_and_validate(
+    pdf_path: str, fields_description: str
+) -> AsyncIterator[tuple[Dict[str, Any], Dict[str, Any] | None]]:
+    """
+    Extract and validate a PDF file, streaming partial extraction results.
+    
+    Uses the same combined cache entry as extract_and_validate; on a hit
+    the complete pair is yielded once without any LLM call.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        fields_description: Description of fields to extract
+        
+    Yields:
+        tuple: Extracted fields parsed so far and None, followed by the
+            complete extraction and its validation results
+    """
+    content = await load_pdf_content(pdf_path)
+    result_hash = _result_cache_key(fields_description, content)
+    cached = check_cache(result_hash, PROMPT_VERSION)
+    if cached is not None:
+        yield cached["extracted_data"], cached["validation_result"]
+        return
+    
+    extracted_data = {}
+    async for extracted_data in _stream_from_content(content, fields_description):
+        yield extracted_data, None
+    
+    validation_result = await validate_extracted_data(fields_description, extracted_data)
+    save_to_cache(result_hash, PROMPT_VERSION, MODEL_ID, {
+        "extracted_data": extracted_data,
+        "validation_result": validation_result,
+    })
+    yield extracted_data, validation_result
 
 
 """ Example Usage
@@ -165,4 +870,7 @@ for field, evaluation in validation_result['field_evaluations'].items():
 # Use the extracted data
 print(f"Candidate: {extracted_data.get('name', 'Unknown')}")
 print(f"Email: {extracted_data.get('email', 'Not provided')}")
+
+# Or extract and validate in one step, cached as a single entry
+extracted_data, validation_result = await extract_and_validate(file_path, fields_description)
 """
\ No newline at end of file